@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from pathlib import Path
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CHILD = r"""
+import json
+import os
+import sys
+
+sys.path.insert(0, sys.argv[1])
+import main
+
+mode, source, file_count, files_per_dir = sys.argv[2], sys.argv[3], int(sys.argv[4]), int(sys.argv[5])
+
+
+def peak_rss():
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+    except ImportError:
+        import ctypes
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD),
+                        ('PeakWorkingSetSize', ctypes.c_size_t), ('WorkingSetSize', ctypes.c_size_t),
+                        ('QuotaPeakPagedPoolUsage', ctypes.c_size_t), ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                        ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t), ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                        ('PagefileUsage', ctypes.c_size_t), ('PeakPagefileUsage', ctypes.c_size_t)]
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        ctypes.windll.psapi.GetProcessMemoryInfo(ctypes.windll.kernel32.GetCurrentProcess(),
+                                                 ctypes.byref(counters), counters.cb)
+        return counters.PeakWorkingSetSize
+
+
+if source == 'synthetic':
+    fake_stat = os.stat_result((0o100644, 0, 0, 1, 0, 0, 1073741824, 0, 0, 0))
+    root = os.path.join(os.sep, 'Media', 'Library')
+
+    def fake_walk(top, *args, **kwargs):
+        yield top, ['TV Shows'], []
+        for dir_index in range(0, file_count, files_per_dir):
+            show = f"Some Fairly Long Show Title {dir_index // (files_per_dir * 10):05d}"
+            season = dir_index // files_per_dir % 10 + 1
+            directory = os.path.join(top, 'TV Shows', show, f"Season {season:02d}")
+            yield directory, [], [f"{show} - S{season:02d}E{i + 1:03d} - Episode Title.mkv"
+                                  for i in range(min(files_per_dir, file_count - dir_index))]
+
+    os.walk = fake_walk
+    os.stat = lambda path, *args, **kwargs: fake_stat
+    source = root
+
+
+def scan_path_list():
+    all_files = []
+    for root, dirs, files in os.walk(source):
+        for file in files:
+            file_path = os.path.join(root, file)
+            if os.path.exists(file_path) and os.path.isfile(file_path):
+                all_files.append(file_path)
+    return all_files
+
+
+def scan_walk_only():
+    count = 0
+    for root, dirs, files in os.walk(source):
+        count += len(files)
+    return count
+
+
+if mode == 'path list':
+    result = scan_path_list()
+elif mode == 'FileTable':
+    result = main.SyncJob(source, source + '-out', 0, [], [], [], main.Localizer('en'), lambda message: None).scan()
+else:
+    result = scan_walk_only()
+print(json.dumps({'peak': peak_rss()}))
+"""
+
+
+def generate_tree(target, file_count, files_per_dir):
+    for dir_index in range(0, file_count, files_per_dir):
+        show = f"Some Fairly Long Show Title {dir_index // (files_per_dir * 10):05d}"
+        season = dir_index // files_per_dir % 10 + 1
+        directory = os.path.join(target, 'TV Shows', show, f"Season {season:02d}")
+        os.makedirs(directory, exist_ok=True)
+        for i in range(min(files_per_dir, file_count - dir_index)):
+            open(os.path.join(directory, f"{show} - S{season:02d}E{i + 1:03d} - Episode Title.mkv"), 'wb').close()
+
+
+def measure(mode, source, file_count, files_per_dir):
+    result = subprocess.run([sys.executable, '-c', CHILD, str(ROOT), mode, source, str(file_count), str(files_per_dir)],
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)['peak']
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare peak RSS of scanning a tree into the file table')
+    parser.add_argument('--files', type=int, default=1000000)
+    parser.add_argument('--files-per-dir', type=int, default=25)
+    parser.add_argument('--tree', choices=['synthetic', 'disk'], default='synthetic',
+                        help='mock os.walk/os.stat (default) or generate empty files in a temporary directory')
+    args = parser.parse_args()
+
+    temp_dir = None
+    source = 'synthetic'
+    if args.tree == 'disk':
+        temp_dir = tempfile.mkdtemp(prefix='path-dumper-bench-')
+        source = os.path.join(temp_dir, 'source')
+        generate_tree(source, args.files, args.files_per_dir)
+
+    try:
+        print(f"{args.tree.capitalize()} tree: {args.files} files, {args.files_per_dir} files per directory")
+        baseline = measure('walk only', source, args.files, args.files_per_dir)
+        print(f"{'walk only':>10}: {baseline / (1024*1024):8.1f} MB peak RSS")
+        growth = {}
+        for mode in ('path list', 'FileTable'):
+            peak = measure(mode, source, args.files, args.files_per_dir)
+            growth[mode] = max(peak - baseline, 1)
+            print(f"{mode:>10}: {peak / (1024*1024):8.1f} MB peak RSS, "
+                  f"{growth[mode] / (1024*1024):8.1f} MB above walk only")
+        print(f"Reduction: {growth['path list'] / growth['FileTable']:.1f}x")
+    finally:
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from pathlib import Path
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = Path(__file__).resolve().parent.parent
+
+LOCALE_SWITCH = """
+import time
+from main import Localizer
+started = time.perf_counter()
+for locale in ('en', 'zh_Hans', 'zh_Hant') * 20:
+    Localizer(locale).get('app_title')
+print(time.perf_counter() - started)
+"""
+
+TIME_TO_WINDOW = """
+from main import PathDumper
+app = PathDumper()
+app.root.wait_visibility()
+app.root.update_idletasks()
+app.root.destroy()
+"""
+
+
+def time_command(command, runs):
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = subprocess.run(command, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        timings.append(time.perf_counter() - started)
+        if result.returncode != 0:
+            return None
+    return timings
+
+
+def report(label, timings):
+    if timings is None:
+        print(f"{label:>22}: skipped, command failed (no display?)")
+        return
+    print(f"{label:>22}: median {statistics.median(timings) * 1000:7.1f} ms, "
+          f"min {min(timings) * 1000:7.1f} ms over {len(timings)} runs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure Path Dumper cold start time')
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--exe', help='also time a packaged build, e.g. dist/PathDumper.exe')
+    args = parser.parse_args()
+
+    report('interpreter only', time_command([sys.executable, '-c', 'pass'], args.runs))
+    report('import main', time_command([sys.executable, '-c', 'import main'], args.runs))
+    report('main.py --help', time_command([sys.executable, 'main.py', '--help'], args.runs))
+    report('time to window', time_command([sys.executable, '-c', TIME_TO_WINDOW], args.runs))
+
+    locale_timings = []
+    for _ in range(args.runs):
+        result = subprocess.run([sys.executable, '-c', LOCALE_SWITCH], cwd=ROOT,
+                                capture_output=True, text=True, check=True)
+        locale_timings.append(float(result.stdout))
+    report('60 locale switches', locale_timings)
+
+    if args.exe:
+        report('packaged --help', time_command([args.exe, '--help'], args.runs))
+
+
+if __name__ == "__main__":
+    main()
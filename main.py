@@ -1,17 +1,84 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+from array import array
 from datetime import datetime
+from errno import ENOENT, ENOTDIR
 from pathlib import Path
-from tkinter import ttk, filedialog, messagebox
+import argparse
+import bisect
+import contextlib
 import json
 import locale
 import os
-import shutil
+import select
+import stat
+import struct
+import sys
 import threading
-import tkinter as tk
+import time
+import zlib
+
+REPLACE_PRESETS = {
+    'preset_video': 'mp4,mkv,avi,mov,wmv,flv,webm,m4v,3gp,ts,vob,rmvb',
+    'preset_audio': 'mp3,flac,wav,aac,ogg,wma,m4a,ape,dts,ac3',
+    'preset_image': 'jpg,jpeg,png,gif,bmp,tiff,svg,webp,raw,cr2,nef',
+    'preset_archive': 'zip,rar,7z,tar,gz,bz2,xz,iso,dmg,img',
+    'preset_executable': 'exe,msi,deb,rpm,pkg,app,dmg,bin,run'
+}
+
+KEEP_PRESETS = {
+    'preset_document': 'txt,doc,docx,pdf,rtf,odt,pages,md,rst',
+    'preset_config': 'json,xml,yaml,yml,ini,cfg,conf,toml,properties',
+    'preset_code': 'py,js,html,css,cpp,c,h,java,php,rb,go,rs',
+    'preset_subtitle': 'srt,ass,ssa,vtt,sub,sbv,lrc,idx,sup',
+    'preset_database': 'db,sqlite,sqlite3,sql,mdb,accdb,dbf'
+}
+
+PLACEHOLDER_HEADERS = {
+    '# Placeholder for large file',
+    '# Placeholder for force-replaced file',
+    '# Copy failed for force-keep file',
+    '# Copy failed for file',
+    '# Error accessing file'
+}
+
+PLACEHOLDER_MAX_SIZE = 8192
+
+
+def lower_io_priority():
+    try:
+        if sys.platform == 'win32':
+            import ctypes
+            
+            kernel32 = ctypes.windll.kernel32
+            thread_mode_background_begin = 0x00010000
+            return bool(kernel32.SetThreadPriority(kernel32.GetCurrentThread(), thread_mode_background_begin))
+        if sys.platform.startswith('linux'):
+            import ctypes
+            
+            ioprio_set = {'x86_64': 251, 'i386': 289, 'i686': 289, 'aarch64': 30, 'armv7l': 314}.get(os.uname().machine)
+            ioprio_who_process = 1
+            ioprio_idle = 3 << 13
+            if ioprio_set is not None:
+                libc = ctypes.CDLL(None, use_errno=True)
+                if libc.syscall(ioprio_set, ioprio_who_process, threading.get_native_id(), ioprio_idle) == 0:
+                    return True
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+            return True
+    except (OSError, AttributeError):
+        pass
+    return False
+
+
+def parse_extensions(text):
+    extensions = [ext.strip().lower() for ext in text.split(',') if ext.strip()]
+    return [ext if ext.startswith('.') else '.' + ext for ext in extensions]
+
 
 class Localizer:
+    cache = {}
+    
     def __init__(self, locale=None):
         if locale is None:
             locale = self.detect_system_locale()
@@ -34,11 +101,16 @@ class Localizer:
             return 'en'
     
     def load_translations(self):
+        if self.locale in Localizer.cache:
+            self.translations = Localizer.cache[self.locale]
+            return
+        
         try:
             locale_file = Path(__file__).parent / 'locales' / f'{self.locale}.json'
             if locale_file.exists():
                 with open(locale_file, 'r', encoding='utf-8') as f:
                     self.translations = json.load(f)
+                Localizer.cache[self.locale] = self.translations
         except Exception as e:
             print(f"Failed to load locale {self.locale}: {e}")
             if self.locale != 'en':
@@ -49,31 +121,1123 @@ class Localizer:
         return self.translations.get(key, default or key)
 
 
+class FileEntry:
+    __slots__ = ('path', 'size', 'mtime', 'mode')
+    
+    def __init__(self, path, size, mtime, mode):
+        self.path = path
+        self.size = size
+        self.mtime = mtime
+        self.mode = mode
+
+
+class FileTable:
+    __slots__ = ('dirs', 'dir_mtimes', 'dir_starts', 'name_blocks', 'pending_names', 'sizes', 'mtimes', 'modes',
+                 'cached_names')
+    
+    def __init__(self):
+        self.dirs = []
+        self.dir_mtimes = array('q')
+        self.dir_starts = array('Q')
+        self.name_blocks = []
+        self.pending_names = bytearray()
+        self.sizes = array('q')
+        self.mtimes = array('q')
+        self.modes = array('H')
+        self.cached_names = (-1, [])
+    
+    def close_dir(self):
+        if self.name_blocks and self.name_blocks[-1] is None:
+            block = bytes(self.pending_names)
+            compressed = zlib.compress(block)
+            self.name_blocks[-1] = b'z' + compressed if len(compressed) < len(block) else b'-' + block
+            self.pending_names = bytearray()
+    
+    def add_dir(self, root, mtime=-1):
+        self.close_dir()
+        self.dirs.append(root)
+        self.dir_mtimes.append(mtime)
+        self.dir_starts.append(len(self.sizes))
+        self.name_blocks.append(None)
+        return len(self.dirs) - 1
+    
+    def add(self, dir_id, name, size, mtime, mode):
+        if dir_id != len(self.dirs) - 1:
+            raise ValueError("Files must be added to the most recently added directory")
+        if self.cached_names[0] == dir_id:
+            self.cached_names = (-1, [])
+        if len(self.sizes) > self.dir_starts[dir_id]:
+            self.pending_names.append(0)
+        self.pending_names += name.encode('utf-8', 'surrogatepass')
+        self.sizes.append(size)
+        self.mtimes.append(mtime)
+        self.modes.append(mode & 0xFFFF)
+    
+    def dir_names(self, dir_id):
+        cached_dir, names = self.cached_names
+        if dir_id == cached_dir:
+            return names
+        block = self.name_blocks[dir_id]
+        if block is None:
+            block = bytes(self.pending_names)
+        elif block[:1] == b'z':
+            block = zlib.decompress(block[1:])
+        else:
+            block = block[1:]
+        names = [name.decode('utf-8', 'surrogatepass') for name in block.split(b'\0')] if self.dir_file_count(dir_id) else []
+        self.cached_names = (dir_id, names)
+        return names
+    
+    def dir_file_count(self, dir_id):
+        end = self.dir_starts[dir_id + 1] if dir_id + 1 < len(self.dirs) else len(self.sizes)
+        return end - self.dir_starts[dir_id]
+    
+    def __len__(self):
+        return len(self.sizes)
+    
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        dir_id = bisect.bisect_right(self.dir_starts, index) - 1
+        name = self.dir_names(dir_id)[index - self.dir_starts[dir_id]]
+        return FileEntry(os.path.join(self.dirs[dir_id], name), self.sizes[index], self.mtimes[index],
+                         self.modes[index])
+    
+    def changes_since(self, previous):
+        previous_dirs = {root: dir_id for dir_id, root in enumerate(previous.dirs)}
+        seen_dirs = set()
+        changed = set()
+        
+        for dir_id, root in enumerate(self.dirs):
+            old_entries = {}
+            old_id = previous_dirs.get(root)
+            if old_id is not None:
+                seen_dirs.add(old_id)
+                start = previous.dir_starts[old_id]
+                for offset, name in enumerate(previous.dir_names(old_id)):
+                    old_entries[name] = (previous.sizes[start + offset], previous.mtimes[start + offset])
+            
+            start = self.dir_starts[dir_id]
+            for offset, name in enumerate(self.dir_names(dir_id)):
+                if old_entries.pop(name, None) != (self.sizes[start + offset], self.mtimes[start + offset]):
+                    changed.add(os.path.join(root, name))
+            changed.update(os.path.join(root, name) for name in old_entries)
+        
+        for old_id, root in enumerate(previous.dirs):
+            if old_id not in seen_dirs:
+                changed.add(root)
+                changed.update(os.path.join(root, name) for name in previous.dir_names(old_id))
+        return changed
+    
+    def __iter__(self):
+        for dir_id, root in enumerate(self.dirs):
+            start = self.dir_starts[dir_id]
+            if self.dir_file_count(dir_id) == 0:
+                continue
+            for offset, name in enumerate(self.dir_names(dir_id)):
+                index = start + offset
+                yield FileEntry(os.path.join(root, name), self.sizes[index], self.mtimes[index], self.modes[index])
+
+
+class TokenBucket:
+    MAX_SLEEP = 0.1
+    
+    def __init__(self, rate=0):
+        self.lock = threading.Lock()
+        self.rate = max(0, rate)
+        self.tokens = self.rate
+        self.updated = time.monotonic()
+    
+    def set_rate(self, rate):
+        with self.lock:
+            self.refill()
+            self.rate = max(0, rate)
+            self.tokens = min(self.tokens, self.rate)
+    
+    def refill(self):
+        now = time.monotonic()
+        if self.rate > 0:
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def consume(self, amount):
+        with self.lock:
+            if self.rate <= 0:
+                return
+            self.refill()
+            self.tokens -= amount
+        
+        while True:
+            with self.lock:
+                if self.rate <= 0:
+                    return
+                self.refill()
+                if self.tokens >= 0:
+                    return
+                wait = -self.tokens / self.rate
+            time.sleep(min(wait, self.MAX_SLEEP))
+
+
+class Throttle:
+    def __init__(self, bytes_per_second=0, files_per_second=0):
+        self.bandwidth = TokenBucket(bytes_per_second)
+        self.file_rate = TokenBucket(files_per_second)
+    
+    def set_limits(self, bytes_per_second, files_per_second):
+        self.bandwidth.set_rate(bytes_per_second)
+        self.file_rate.set_rate(files_per_second)
+
+
+class SyncJob:
+    COPY_CHUNK_SIZE = 1024 * 1024
+    
+    
+    def __init__(self, source_dir, output_dir, size_threshold, exclude_dirs, force_replace_exts, force_keep_exts,
+                 localizer, log):
+        self.source_dir = os.path.abspath(source_dir)
+        self.output_dir = output_dir
+        self.size_threshold = size_threshold
+        self.exclude_dirs = [d.replace('\\', os.sep).replace('/', os.sep) for d in exclude_dirs]
+        self.force_replace_exts = force_replace_exts
+        self.force_keep_exts = force_keep_exts
+        self.localizer = localizer
+        self.log = log
+        self.io_limit = contextlib.nullcontext()
+        self.preserve_dir_times = False
+        self.throttle = Throttle()
+        self.low_io_priority = False
+        
+        self.large_files_count = 0
+        self.force_replaced_count = 0
+        self.force_kept_count = 0
+        self.error_count = 0
+        self.last_log_time = 0
+        self.log_interval = 1.0
+    
+    def check_paths(self):
+        source_path = Path(self.source_dir).resolve()
+        output_path = Path(self.output_dir).resolve()
+        
+        try:
+            output_path.relative_to(source_path)
+            return 'output_inside_source'
+        except ValueError:
+            pass
+        
+        try:
+            source_path.relative_to(output_path)
+            return 'source_inside_output'
+        except ValueError:
+            pass
+        
+        if not os.path.exists(self.source_dir) or not os.path.isdir(self.source_dir):
+            return 'invalid_source_dir'
+        
+        os.makedirs(self.output_dir, exist_ok=True)
+        
+        try:
+            test_files = list(os.listdir(self.source_dir))[:5]
+            self.log(f"Directory access test passed, found {len(test_files)} test items")
+        except PermissionError:
+            return 'permission_denied'
+        
+        return None
+    
+    def is_excluded_root(self, root, rel_root):
+        rel_root_normalized = rel_root.replace('\\', os.sep).replace('/', os.sep)
+        for exclude_dir in self.exclude_dirs:
+            if (rel_root_normalized == exclude_dir or
+                rel_root_normalized.startswith(exclude_dir + os.sep) or
+                exclude_dir.startswith(rel_root_normalized + os.sep) or
+                (os.sep + exclude_dir + os.sep) in (os.sep + rel_root_normalized + os.sep) or
+                exclude_dir in os.path.basename(root)):
+                return True
+        return False
+    
+    def is_excluded_child(self, rel_root, d):
+        for exclude_dir in self.exclude_dirs:
+            if (d == exclude_dir or
+                exclude_dir == os.path.join(rel_root, d) or
+                exclude_dir in d):
+                return True
+        return False
+    
+    def is_excluded_path(self, rel_path):
+        rel_root = '.'
+        if self.is_excluded_root(self.source_dir, rel_root):
+            return True
+        for part in os.path.normpath(rel_path).split(os.sep)[:-1]:
+            if self.is_excluded_child(rel_root, part):
+                return True
+            rel_root = part if rel_root == '.' else os.path.join(rel_root, part)
+            if self.is_excluded_root(os.path.join(self.source_dir, rel_root), rel_root):
+                return True
+        return False
+    
+    def walk(self, top=None):
+        for root, dirs, files in os.walk(top or self.source_dir):
+            rel_root = os.path.relpath(root, self.source_dir)
+            
+            if self.is_excluded_root(root, rel_root):
+                dirs.clear()
+                yield root, files, True
+                continue
+            
+            dirs[:] = [d for d in dirs if not self.is_excluded_child(rel_root, d)]
+            yield root, files, False
+    
+    def scan(self, log_progress=True):
+        file_table = FileTable()
+        skipped_count = 0
+        excluded_count = 0
+        processed_dirs = 0
+        
+        walker = self.walk()
+        while True:
+            with self.io_limit:
+                step = next(walker, None)
+                if step is None:
+                    break
+                root, files, excluded = step
+                if excluded:
+                    excluded_count += len(files)
+                    continue
+                
+                processed_dirs += 1
+                if log_progress and processed_dirs % 10 == 0:
+                    self.log(f"Scanning... processed {processed_dirs} directories, found {len(file_table)} files")
+                
+                try:
+                    root_str = str(root)
+                    dir_id = file_table.add_dir(root_str, os.stat(root_str).st_mtime_ns if self.preserve_dir_times else -1)
+                    for file in files:
+                        try:
+                            file_stat = os.stat(os.path.join(root_str, file))
+                            if stat.S_ISREG(file_stat.st_mode):
+                                file_table.add(dir_id, file, file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_mode)
+                            else:
+                                skipped_count += 1
+                        except (UnicodeDecodeError, OSError) as e:
+                            skipped_count += 1
+                            continue
+                except Exception as e:
+                    self.log(f"Error accessing directory {root}: {e}")
+                    continue
+                        
+        return file_table, skipped_count, excluded_count
+    
+    def log_throttled(self, message):
+        current_time = datetime.now().timestamp()
+        if current_time - self.last_log_time > self.log_interval:
+            self.log(message)
+            self.last_log_time = current_time
+    
+    def write_placeholder(self, dest_path, lines, entry=None):
+        try:
+            f = open(dest_path, 'w', encoding='utf-8')
+        except PermissionError:
+            os.chmod(dest_path, stat.S_IREAD | stat.S_IWRITE)
+            f = open(dest_path, 'w', encoding='utf-8')
+        with f:
+            f.write(''.join(f"{line}\n" for line in lines))
+        
+        if entry is not None:
+            os.utime(dest_path, ns=(entry.mtime, entry.mtime))
+            os.chmod(dest_path, stat.S_IMODE(entry.mode) | stat.S_IWUSR)
+    
+    def copy_file(self, file_path, dest_path):
+        try:
+            self.copy_contents(file_path, dest_path)
+        except PermissionError:
+            if not os.path.lexists(dest_path):
+                raise
+            os.chmod(dest_path, stat.S_IREAD | stat.S_IWRITE)
+            self.copy_contents(file_path, dest_path)
+    
+    def copy_contents(self, file_path, dest_path):
+        import shutil
+        
+        if self.throttle.bandwidth.rate <= 0:
+            shutil.copy2(file_path, dest_path)
+            return
+        
+        with open(file_path, 'rb') as src, open(dest_path, 'wb') as dst:
+            while True:
+                chunk = src.read(self.COPY_CHUNK_SIZE)
+                if not chunk:
+                    break
+                self.throttle.bandwidth.consume(len(chunk))
+                dst.write(chunk)
+        shutil.copystat(file_path, dest_path)
+    
+    def dump_file(self, file_path, entry=None):
+        self.throttle.file_rate.consume(1)
+        
+        try:
+            rel_path = os.path.relpath(file_path, self.source_dir)
+        except ValueError:
+            rel_path = file_path.replace(self.source_dir, '').lstrip(os.sep)
+        
+        dest_path = os.path.join(self.output_dir, rel_path)
+        
+        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+        
+        try:
+            if entry is None:
+                file_stat = os.stat(file_path)
+                entry = FileEntry(file_path, file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_mode)
+            file_size = entry.size
+            file_ext = os.path.splitext(file_path)[1].lower()
+        except (OSError, IOError) as e:
+            self.write_placeholder(dest_path, [
+                "# Error accessing file",
+                f"# Original path: {file_path}",
+                f"# Error: {e}"])
+            return
+        
+        force_keep = file_ext in self.force_keep_exts
+        
+        force_replace = file_ext in self.force_replace_exts
+        
+        if force_keep:
+            try:
+                self.copy_file(file_path, dest_path)
+                self.force_kept_count += 1
+                self.log_throttled(f"{self.localizer.get('force_kept_file')}: {rel_path}")
+            except (OSError, IOError, PermissionError) as e:
+                self.write_placeholder(dest_path, [
+                    "# Copy failed for force-keep file",
+                    f"# Original size: {file_size} bytes",
+                    f"# Original path: {file_path}",
+                    f"# Error: {e}"])
+                self.error_count += 1
+        elif force_replace or file_size > self.size_threshold:
+            if force_replace:
+                lines = ["# Placeholder for force-replaced file", f"# Extension: {file_ext}"]
+            else:
+                lines = ["# Placeholder for large file"]
+            lines.append(f"# Original size: {file_size} bytes")
+            lines.append(f"# Original path: {file_path}")
+            self.write_placeholder(dest_path, lines, entry)
+            
+            if force_replace:
+                self.force_replaced_count += 1
+                self.log_throttled(f"{self.localizer.get('force_replaced_file')}: {rel_path}")
+            else:
+                self.large_files_count += 1
+                self.log_throttled(f"{self.localizer.get('replaced_large_file')}: {rel_path} ({file_size} bytes)")
+        else:
+            try:
+                self.copy_file(file_path, dest_path)
+            except (OSError, IOError, PermissionError) as e:
+                self.write_placeholder(dest_path, [
+                    "# Copy failed for file",
+                    f"# Original size: {file_size} bytes",
+                    f"# Original path: {file_path}",
+                    f"# Error: {e}"])
+                self.error_count += 1
+    
+    def restore_dir_times(self, file_table):
+        restored = 0
+        for index in range(len(file_table.dirs) - 1, -1, -1):
+            mtime = file_table.dir_mtimes[index]
+            if mtime < 0:
+                continue
+            rel_root = os.path.relpath(file_table.dirs[index], self.source_dir)
+            try:
+                os.utime(os.path.normpath(os.path.join(self.output_dir, rel_root)), ns=(mtime, mtime))
+                restored += 1
+            except OSError:
+                continue
+        self.log(f"Restored timestamps of {restored} directories")
+    
+    def dump_all(self, file_table, progress=None):
+        total_files = len(file_table)
+        processed = 0
+        
+        if self.low_io_priority and not lower_io_priority():
+            self.log("Could not lower I/O priority on this platform")
+        
+        for entry in file_table:
+            try:
+                with self.io_limit:
+                    self.dump_file(entry.path, entry)
+                processed += 1
+                
+                if progress is not None and total_files > 0 and processed % 10 == 0:
+                    progress(processed, total_files)
+                
+                if processed % 50 == 0:
+                    progress_percent = int((processed / total_files) * 100) if total_files > 0 else 0
+                    self.log(f"Processing... {processed}/{total_files} files ({progress_percent}%) - {self.large_files_count} large, {self.force_replaced_count} force replaced, {self.force_kept_count} force kept")
+                
+                if processed % 1000 == 0:
+                    self.log(f"Milestone: {processed} files processed, {self.large_files_count} large files, {self.force_replaced_count} force replaced, {self.force_kept_count} force kept, {self.error_count} errors")
+                
+            except Exception as e:
+                self.log(f"{self.localizer.get('error_processing_file')}: {entry.path} - {e}")
+                self.error_count += 1
+        
+        if self.preserve_dir_times:
+            self.restore_dir_times(file_table)
+        
+        return processed
+    
+    def remove_dest(self, rel_path):
+        import shutil
+        
+        dest_path = os.path.join(self.output_dir, rel_path)
+        if os.path.isdir(dest_path) and not os.path.islink(dest_path):
+            shutil.rmtree(dest_path, ignore_errors=True)
+        elif os.path.lexists(dest_path):
+            os.remove(dest_path)
+    
+    def create_watcher(self, stop_event):
+        if sys.platform.startswith('linux'):
+            try:
+                return InotifyWatcher(self)
+            except (OSError, AttributeError) as e:
+                self.log(f"inotify unavailable, falling back to polling: {e}")
+        elif sys.platform == 'win32':
+            try:
+                return WindowsWatcher(self)
+            except (OSError, AttributeError) as e:
+                self.log(f"ReadDirectoryChangesW unavailable, falling back to polling: {e}")
+        return PollingWatcher(self, stop_event)
+    
+    def apply_changes(self, changed_paths):
+        updated = 0
+        removed = 0
+        for file_path in sorted(changed_paths):
+            rel_path = os.path.relpath(file_path, self.source_dir)
+            if rel_path.startswith(os.pardir) or self.is_excluded_path(rel_path):
+                continue
+            try:
+                if os.path.isfile(file_path):
+                    self.dump_file(file_path)
+                    updated += 1
+                elif not os.path.lexists(file_path):
+                    self.remove_dest(rel_path)
+                    removed += 1
+            except Exception as e:
+                self.log(f"{self.localizer.get('error_processing_file')}: {file_path} - {e}")
+                self.error_count += 1
+        self.log(f"{self.localizer.get('watch_applied')}: {updated} updated, {removed} removed")
+    
+    def watch(self, watcher, stop_event, file_table, poll_interval=1.0, debounce=2.0, max_latency=30.0):
+        self.log(f"{self.localizer.get('watch_started')} ({watcher.name})")
+        watcher.start(file_table)
+        pending = set()
+        first_change = 0
+        last_change = 0
+        try:
+            while not stop_event.is_set():
+                try:
+                    changes = watcher.poll(poll_interval)
+                except OSError as e:
+                    self.log(f"{watcher.name} watcher failed, falling back to polling: {e}")
+                    watcher.close()
+                    watcher = PollingWatcher(self, stop_event)
+                    changes = None
+                
+                if changes is None:
+                    self.log("Change events were lost, rescanning source directory")
+                    watcher.rearm()
+                    rescanned = self.scan(log_progress=False)[0]
+                    changes = rescanned.changes_since(file_table)
+                    file_table = rescanned
+                    watcher.start(file_table)
+                
+                now = time.monotonic()
+                if changes:
+                    if not pending:
+                        first_change = now
+                    pending.update(changes)
+                    last_change = now
+                if pending and (now - last_change >= debounce or now - first_change >= max_latency):
+                    batch, pending = pending, set()
+                    self.apply_changes(batch)
+        finally:
+            watcher.close()
+            self.log(self.localizer.get('watch_stopped'))
+
+
+class PollingWatcher:
+    name = 'polling'
+    
+    def __init__(self, job, stop_event, interval=30.0):
+        self.job = job
+        self.stop_event = stop_event
+        self.interval = interval
+        self.file_table = None
+        self.last_scan = time.monotonic()
+    
+    def start(self, file_table):
+        self.file_table = file_table
+        self.last_scan = time.monotonic()
+    
+    def rearm(self):
+        pass
+    
+    def poll(self, timeout):
+        if self.stop_event.wait(timeout) or time.monotonic() - self.last_scan < self.interval:
+            return set()
+        file_table = self.job.scan(log_progress=False)[0]
+        self.last_scan = time.monotonic()
+        if self.file_table is None:
+            self.file_table = file_table
+            return set()
+        changed = file_table.changes_since(self.file_table)
+        self.file_table = file_table
+        return changed
+    
+    def close(self):
+        self.file_table = None
+
+
+class InotifyWatcher:
+    name = 'inotify'
+    
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    WATCH_MASK = (IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE)
+    EVENT_HEADER = struct.Struct('iIII')
+    
+    def __init__(self, job):
+        import ctypes
+        import ctypes.util
+        
+        self.ctypes = ctypes
+        self.job = job
+        self.libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self.watches = {}
+        try:
+            self.add_tree(job.source_dir)
+        except OSError:
+            self.close()
+            raise
+    
+    def start(self, file_table):
+        pass
+    
+    def rearm(self):
+        self.add_tree(self.job.source_dir)
+    
+    def add_tree(self, path):
+        found_files = set()
+        for root, files, excluded in self.job.walk(path):
+            if excluded:
+                continue
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(root), self.WATCH_MASK)
+            if wd < 0:
+                errno = self.ctypes.get_errno()
+                if errno not in (ENOENT, ENOTDIR):
+                    raise OSError(errno, f"inotify_add_watch failed for {root}: {os.strerror(errno)}")
+                continue
+            self.watches[wd] = root
+            found_files.update(os.path.join(root, file) for file in files)
+        return found_files
+    
+    def remove_tree(self, path):
+        prefix = path.rstrip(os.sep) + os.sep
+        for wd, root in list(self.watches.items()):
+            if root == path or root.startswith(prefix):
+                self.libc.inotify_rm_watch(self.fd, wd)
+                del self.watches[wd]
+    
+    def poll(self, timeout):
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+        
+        changed = set()
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, cookie, length = self.EVENT_HEADER.unpack_from(data, offset)
+                offset += self.EVENT_HEADER.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+                offset += length
+                
+                if mask & self.IN_Q_OVERFLOW:
+                    return None
+                if mask & self.IN_IGNORED:
+                    self.watches.pop(wd, None)
+                    continue
+                directory = self.watches.get(wd)
+                if directory is None or not name:
+                    continue
+                path = os.path.join(directory, name)
+                if mask & self.IN_ISDIR and mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    changed.update(self.add_tree(path))
+                else:
+                    if mask & self.IN_ISDIR and mask & (self.IN_MOVED_FROM | self.IN_DELETE):
+                        self.remove_tree(path)
+                    changed.add(path)
+        return changed
+    
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class WindowsWatcher:
+    name = 'ReadDirectoryChangesW'
+    
+    FILE_LIST_DIRECTORY = 0x0001
+    FILE_SHARE_ALL = 0x00000007
+    OPEN_EXISTING = 3
+    FILE_FLAG_BACKUP_SEMANTICS = 0x02000000
+    FILE_FLAG_OVERLAPPED = 0x40000000
+    FILE_NOTIFY_CHANGE_FILE_NAME = 0x00000001
+    FILE_NOTIFY_CHANGE_DIR_NAME = 0x00000002
+    FILE_NOTIFY_CHANGE_SIZE = 0x00000008
+    FILE_NOTIFY_CHANGE_LAST_WRITE = 0x00000010
+    NOTIFY_FILTER = (FILE_NOTIFY_CHANGE_FILE_NAME | FILE_NOTIFY_CHANGE_DIR_NAME |
+                     FILE_NOTIFY_CHANGE_SIZE | FILE_NOTIFY_CHANGE_LAST_WRITE)
+    FILE_ACTION_ADDED = 1
+    FILE_ACTION_RENAMED_NEW_NAME = 5
+    WAIT_OBJECT_0 = 0
+    ERROR_NOTIFY_ENUM_DIR = 1022
+    BUFFER_SIZE = 64 * 1024
+    NOTIFY_HEADER = struct.Struct('<III')
+    
+    def __init__(self, job):
+        import ctypes
+        from ctypes import wintypes
+        
+        class Overlapped(ctypes.Structure):
+            _fields_ = [('Internal', ctypes.c_void_p), ('InternalHigh', ctypes.c_void_p),
+                        ('Offset', wintypes.DWORD), ('OffsetHigh', wintypes.DWORD), ('hEvent', wintypes.HANDLE)]
+        
+        self.ctypes = ctypes
+        self.job = job
+        kernel32 = self.kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        kernel32.CreateFileW.restype = wintypes.HANDLE
+        kernel32.CreateFileW.argtypes = [wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, wintypes.LPVOID,
+                                         wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE]
+        kernel32.CreateEventW.restype = wintypes.HANDLE
+        kernel32.CreateEventW.argtypes = [wintypes.LPVOID, wintypes.BOOL, wintypes.BOOL, wintypes.LPCWSTR]
+        kernel32.ResetEvent.argtypes = [wintypes.HANDLE]
+        kernel32.ReadDirectoryChangesW.argtypes = [wintypes.HANDLE, wintypes.LPVOID, wintypes.DWORD, wintypes.BOOL,
+                                                   wintypes.DWORD, wintypes.LPDWORD, wintypes.LPVOID, wintypes.LPVOID]
+        kernel32.WaitForSingleObject.restype = wintypes.DWORD
+        kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+        kernel32.GetOverlappedResult.argtypes = [wintypes.HANDLE, wintypes.LPVOID, wintypes.LPDWORD, wintypes.BOOL]
+        kernel32.CancelIoEx.argtypes = [wintypes.HANDLE, wintypes.LPVOID]
+        kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        
+        self.handle = kernel32.CreateFileW(os.path.abspath(job.source_dir), self.FILE_LIST_DIRECTORY,
+                                           self.FILE_SHARE_ALL, None, self.OPEN_EXISTING,
+                                           self.FILE_FLAG_BACKUP_SEMANTICS | self.FILE_FLAG_OVERLAPPED, None)
+        if not self.handle or self.handle == ctypes.c_void_p(-1).value:
+            self.handle = None
+            raise ctypes.WinError(ctypes.get_last_error())
+        self.event = kernel32.CreateEventW(None, True, False, None)
+        self.overlapped = Overlapped(hEvent=self.event)
+        self.buffer = ctypes.create_string_buffer(self.BUFFER_SIZE)
+        self.pending = False
+        try:
+            self.issue_read()
+        except OSError:
+            self.close()
+            raise
+    
+    def start(self, file_table):
+        pass
+    
+    def rearm(self):
+        pass
+    
+    def issue_read(self):
+        self.kernel32.ResetEvent(self.event)
+        if not self.kernel32.ReadDirectoryChangesW(self.handle, self.buffer, self.BUFFER_SIZE, True,
+                                                   self.NOTIFY_FILTER, None, self.ctypes.byref(self.overlapped), None):
+            raise self.ctypes.WinError(self.ctypes.get_last_error())
+        self.pending = True
+    
+    def poll(self, timeout):
+        from ctypes import wintypes
+        
+        if self.kernel32.WaitForSingleObject(self.event, int(timeout * 1000)) != self.WAIT_OBJECT_0:
+            return set()
+        
+        transferred = wintypes.DWORD()
+        self.pending = False
+        if not self.kernel32.GetOverlappedResult(self.handle, self.ctypes.byref(self.overlapped),
+                                                 self.ctypes.byref(transferred), False):
+            error = self.ctypes.get_last_error()
+            if error != self.ERROR_NOTIFY_ENUM_DIR:
+                raise self.ctypes.WinError(error)
+            transferred.value = 0
+        data = self.buffer.raw[:transferred.value]
+        self.issue_read()
+        if not data:
+            return None
+        
+        changed = set()
+        offset = 0
+        while True:
+            next_offset, action, length = self.NOTIFY_HEADER.unpack_from(data, offset)
+            start = offset + self.NOTIFY_HEADER.size
+            name = data[start:start + length].decode('utf-16-le', 'surrogatepass')
+            path = os.path.join(self.job.source_dir, name)
+            if action in (self.FILE_ACTION_ADDED, self.FILE_ACTION_RENAMED_NEW_NAME) and os.path.isdir(path):
+                for root, files, excluded in self.job.walk(path):
+                    if not excluded:
+                        changed.update(os.path.join(root, file) for file in files)
+            else:
+                changed.add(path)
+            if next_offset == 0:
+                break
+            offset += next_offset
+        return changed
+    
+    def close(self):
+        from ctypes import wintypes
+        
+        if self.handle is None:
+            return
+        if self.pending:
+            self.kernel32.CancelIoEx(self.handle, self.ctypes.byref(self.overlapped))
+            self.kernel32.GetOverlappedResult(self.handle, self.ctypes.byref(self.overlapped),
+                                              self.ctypes.byref(wintypes.DWORD()), True)
+            self.pending = False
+        self.kernel32.CloseHandle(self.handle)
+        self.kernel32.CloseHandle(self.event)
+        self.handle = None
+
+
+class BatchRunner:
+    RELOAD_INTERVAL = 5.0
+    CONFIG_KEYS = {'max_workers', 'max_io', 'bandwidth_limit', 'file_rate_limit', 'low_io_priority', 'defaults', 'jobs'}
+    JOB_KEYS = {'name', 'source', 'output', 'size_threshold', 'exclude_dirs', 'force_replace', 'force_keep',
+                'replace_presets', 'keep_presets', 'preserve_dir_times'}
+    
+    def __init__(self, batch_file, localizer, log, bytes_per_second=0, files_per_second=0):
+        self.localizer = localizer
+        self.log = log
+        self.throttle = Throttle(bytes_per_second, files_per_second)
+        self.batch_file = batch_file
+        self.batch_mtime = os.stat(batch_file).st_mtime_ns
+        
+        config = self.read_config()
+        self.check_keys(config, self.CONFIG_KEYS, 'batch file')
+        self.max_workers = max(1, int(self.number(config, 'max_workers', 2, 'batch file')))
+        self.io_limit = threading.BoundedSemaphore(max(1, int(self.number(config, 'max_io', self.max_workers, 'batch file'))))
+        self.apply_limits(config)
+        self.low_io_priority = self.flag(config, 'low_io_priority', 'batch file')
+        defaults = config.get('defaults', {})
+        jobs = config.get('jobs', [])
+        if not isinstance(defaults, dict):
+            raise ValueError("defaults must be an object")
+        self.check_keys(defaults, self.JOB_KEYS, 'defaults')
+        if not isinstance(jobs, list) or not all(isinstance(settings, dict) for settings in jobs):
+            raise ValueError("jobs must be a list of objects")
+        self.jobs = [self.build_job(dict(defaults, **settings), index)
+                     for index, settings in enumerate(jobs, 1)]
+        if not self.jobs:
+            raise ValueError(f"No jobs defined in {batch_file}")
+        self.check_overlaps()
+    
+    def read_config(self):
+        with open(self.batch_file, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        if not isinstance(config, dict):
+            raise ValueError(f"{self.batch_file} must contain a JSON object")
+        return config
+    
+    def apply_limits(self, config):
+        if 'bandwidth_limit' in config or 'file_rate_limit' in config:
+            self.throttle.set_limits(self.number(config, 'bandwidth_limit', 0, 'batch file') * 1024 * 1024,
+                                     self.number(config, 'file_rate_limit', 0, 'batch file'))
+            return True
+        return False
+    
+    def reload_limits(self):
+        try:
+            mtime = os.stat(self.batch_file).st_mtime_ns
+            if mtime == self.batch_mtime:
+                return
+            self.batch_mtime = mtime
+            if not self.apply_limits(self.read_config()):
+                return
+        except (OSError, ValueError) as e:
+            self.log(f"Could not reload limits from {self.batch_file}: {e}")
+            return
+        self.log(f"Limits reloaded: {self.throttle.bandwidth.rate / (1024 * 1024):g} MB/s, "
+                 f"{self.throttle.file_rate.rate:g} files/s")
+    
+    @staticmethod
+    def check_keys(settings, allowed, name):
+        unknown = sorted(set(settings) - allowed)
+        if unknown:
+            raise ValueError(f"{name}: unknown keys {', '.join(unknown)}")
+    
+    @staticmethod
+    def flag(settings, key, name):
+        value = settings.get(key, False)
+        if not isinstance(value, bool):
+            raise ValueError(f"{name}: {key} must be true or false, got {value!r}")
+        return value
+    
+    @staticmethod
+    def number(settings, key, default, name):
+        value = settings.get(key, default)
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+            raise ValueError(f"{name}: {key} must be a non-negative number, got {value!r}")
+        return value
+    
+    @staticmethod
+    def string_list(settings, key, name):
+        value = settings.get(key, [])
+        if isinstance(value, str):
+            return [item.strip() for item in value.split(',') if item.strip()]
+        if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+            raise ValueError(f"Job {name}: {key} must be a string or a list of strings")
+        return value
+    
+    def build_job(self, settings, index):
+        name = str(settings.get('name') or f"job{index}")
+        self.check_keys(settings, self.JOB_KEYS, f"Job {name}")
+        try:
+            source_dir = settings['source']
+            output_dir = settings['output']
+        except KeyError as e:
+            raise ValueError(f"Job {name} is missing {e}")
+        if not isinstance(source_dir, str) or not isinstance(output_dir, str) or not source_dir or not output_dir:
+            raise ValueError(f"Job {name} needs a non-empty source and output path")
+        
+        size_threshold = self.number(settings, 'size_threshold', 30, f"Job {name}") * 1024 * 1024
+        exclude_dirs = self.string_list(settings, 'exclude_dirs', name)
+        
+        force_replace_exts = self.collect_extensions(name, settings, 'force_replace', 'replace_presets', REPLACE_PRESETS)
+        force_keep_exts = self.collect_extensions(name, settings, 'force_keep', 'keep_presets', KEEP_PRESETS)
+        
+        def job_log(message):
+            self.log(f"[{name}] {message}")
+        
+        job = SyncJob(source_dir, output_dir, size_threshold, exclude_dirs, force_replace_exts, force_keep_exts,
+                      self.localizer, job_log)
+        job.io_limit = self.io_limit
+        job.preserve_dir_times = self.flag(settings, 'preserve_dir_times', f"Job {name}")
+        job.throttle = self.throttle
+        job.low_io_priority = self.low_io_priority
+        return name, job
+    
+    def collect_extensions(self, name, settings, extensions_key, presets_key, presets):
+        extensions = ','.join(self.string_list(settings, extensions_key, name))
+        
+        for preset_key in self.string_list(settings, presets_key, name):
+            if preset_key not in presets:
+                raise ValueError(f"Job {name} uses unknown preset {preset_key}")
+            extensions += ',' + presets[preset_key]
+        
+        seen = set()
+        return [x for x in parse_extensions(extensions) if not (x in seen or seen.add(x))]
+    
+    def check_overlaps(self):
+        def resolve(path):
+            return os.path.normcase(str(Path(path).resolve()))
+        
+        def overlaps(a, b):
+            return a == b or a.startswith(b.rstrip(os.sep) + os.sep) or b.startswith(a.rstrip(os.sep) + os.sep)
+        
+        resolved = [(name, resolve(job.source_dir), resolve(job.output_dir)) for name, job in self.jobs]
+        for i, (name, source, output) in enumerate(resolved):
+            for other_name, other_source, other_output in resolved[i + 1:]:
+                if overlaps(output, other_output):
+                    raise ValueError(f"Jobs {name} and {other_name} write to overlapping outputs")
+                if overlaps(output, other_source) or overlaps(other_output, source):
+                    raise ValueError(f"Jobs {name} and {other_name} overlap: one writes into the other's source")
+    
+    def run_job(self, name, job):
+        started = time.monotonic()
+        result = {'name': name, 'error': None, 'total_files': 0}
+        try:
+            job.log(f"Source: {job.source_dir}")
+            job.log(f"Output: {job.output_dir}")
+            error_key = job.check_paths()
+            if error_key:
+                result['error'] = self.localizer.get(error_key)
+            else:
+                file_table, skipped_count, excluded_count = job.scan()
+                result['total_files'] = len(file_table)
+                job.log(f"{self.localizer.get('found_files')}: {len(file_table)}")
+                job.dump_all(file_table)
+                job.log(self.localizer.get('dump_completed'))
+        except Exception as e:
+            result['error'] = str(e)
+            job.log(f"{self.localizer.get('dump_failed')}: {e}")
+        
+        result.update(large_files=job.large_files_count, force_replaced=job.force_replaced_count,
+                      force_kept=job.force_kept_count, errors=job.error_count,
+                      elapsed=time.monotonic() - started)
+        return result
+    
+    def run(self):
+        import concurrent.futures
+        
+        self.log(f"Running {len(self.jobs)} batch jobs with {self.max_workers} workers")
+        finished = threading.Event()
+        
+        def reload_loop():
+            while not finished.wait(self.RELOAD_INTERVAL):
+                self.reload_limits()
+        
+        threading.Thread(target=reload_loop, daemon=True).start()
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(executor.map(lambda item: self.run_job(*item), self.jobs))
+        finally:
+            finished.set()
+        
+        self.log(self.localizer.get('batch_summary'))
+        for result in results:
+            if result['error']:
+                self.log(f"  {result['name']}: {self.localizer.get('failed')} - {result['error']}")
+            else:
+                self.log(f"  {result['name']}: {result['total_files']} files, {result['large_files']} large, "
+                         f"{result['force_replaced']} force replaced, {result['force_kept']} force kept, "
+                         f"{result['errors']} errors ({result['elapsed']:.1f}s)")
+        
+        failed = sum(1 for result in results if result['error'])
+        self.log(f"{self.localizer.get('batch_completed')}: {len(results) - failed}/{len(results)}")
+        return results
+
+
+class PlaceholderIndex:
+    BATCH_SIZE = 256
+    
+    def __init__(self, dump_dir, max_workers=8):
+        self.dump_dir = dump_dir
+        self.max_workers = max(1, max_workers)
+        self.rel_paths = []
+        self.original_paths = []
+        self.original_sizes = array('q')
+    
+    def candidates(self):
+        stack = [self.dump_dir]
+        batch = []
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False) and entry.stat().st_size <= PLACEHOLDER_MAX_SIZE:
+                                batch.append(entry.path)
+                                if len(batch) >= self.BATCH_SIZE:
+                                    yield batch
+                                    batch = []
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        if batch:
+            yield batch
+    
+    @staticmethod
+    def parse_placeholder(path):
+        try:
+            with open(path, 'r', encoding='utf-8', errors='surrogateescape') as f:
+                if f.readline().rstrip('\n') not in PLACEHOLDER_HEADERS:
+                    return None
+                original_path = None
+                original_size = -1
+                for line in f:
+                    if line.startswith('# Original path: '):
+                        original_path = line[len('# Original path: '):].rstrip('\n')
+                    elif line.startswith('# Original size: '):
+                        original_size = int(line[len('# Original size: '):].split()[0])
+        except (OSError, ValueError):
+            return None
+        if original_path is None:
+            return None
+        return original_path, original_size
+    
+    def parse_batch(self, paths):
+        return [(path, self.parse_placeholder(path)) for path in paths]
+    
+    def build(self):
+        import concurrent.futures
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for results in executor.map(self.parse_batch, self.candidates()):
+                for path, parsed in results:
+                    if parsed is None:
+                        continue
+                    self.rel_paths.append(os.path.relpath(path, self.dump_dir))
+                    self.original_paths.append(parsed[0])
+                    self.original_sizes.append(parsed[1])
+        return self
+    
+    def __len__(self):
+        return len(self.rel_paths)
+    
+    @staticmethod
+    def normalize(path):
+        return os.path.normcase(os.path.normpath(path.replace('\\', os.sep).replace('/', os.sep)))
+    
+    def plan(self, subtree=''):
+        subtree = self.normalize(subtree) if subtree else '.'
+        keys = self.rel_paths
+        if os.path.isabs(subtree):
+            try:
+                rel_subtree = os.path.relpath(subtree, self.dump_dir)
+            except ValueError:
+                rel_subtree = os.pardir
+            if rel_subtree.startswith(os.pardir):
+                keys = self.original_paths
+            else:
+                subtree = self.normalize(rel_subtree)
+        
+        prefix = subtree.rstrip(os.sep) + os.sep
+        plan = []
+        for index, key in enumerate(keys):
+            key = self.normalize(key)
+            if subtree == '.' or key == subtree or key.startswith(prefix):
+                plan.append((self.rel_paths[index], self.original_paths[index], self.original_sizes[index]))
+        plan.sort()
+        return plan
+
+
 class PathDumper:
     def __init__(self):
         self.localizer = Localizer()
         self.setup_presets()
         self.setup_gui()
         self.is_processing = False
+        self.stop_event = threading.Event()
     
     def setup_presets(self):
-        self.replace_presets = {
-            'preset_video': 'mp4,mkv,avi,mov,wmv,flv,webm,m4v,3gp,ts,vob,rmvb',
-            'preset_audio': 'mp3,flac,wav,aac,ogg,wma,m4a,ape,dts,ac3',
-            'preset_image': 'jpg,jpeg,png,gif,bmp,tiff,svg,webp,raw,cr2,nef',
-            'preset_archive': 'zip,rar,7z,tar,gz,bz2,xz,iso,dmg,img',
-            'preset_executable': 'exe,msi,deb,rpm,pkg,app,dmg,bin,run'
-        }
+        self.replace_presets = dict(REPLACE_PRESETS)
         
-        self.keep_presets = {
-            'preset_document': 'txt,doc,docx,pdf,rtf,odt,pages,md,rst',
-            'preset_config': 'json,xml,yaml,yml,ini,cfg,conf,toml,properties',
-            'preset_code': 'py,js,html,css,cpp,c,h,java,php,rb,go,rs',
-            'preset_subtitle': 'srt,ass,ssa,vtt,sub,sbv,lrc,idx,sup',
-            'preset_database': 'db,sqlite,sqlite3,sql,mdb,accdb,dbf'
-        }
+        self.keep_presets = dict(KEEP_PRESETS)
         
     def setup_gui(self):
+        import tkinter as tk
+        from tkinter import ttk
+        
         self.root = tk.Tk()
         self.root.title(self.localizer.get('app_title', 'Path Dumper'))
         self.root.geometry('720x800')
@@ -148,6 +1312,44 @@ class PathDumper:
         size_spinbox.grid(row=0, column=0, padx=(0, 5))
         ttk.Label(size_frame, text="MB").grid(row=0, column=1)
         
+        self.watch_var = tk.BooleanVar(value=False)
+        self.watch_check = ttk.Checkbutton(size_frame, text=self.localizer.get('watch_changes'),
+                                          variable=self.watch_var)
+        self.watch_check.grid(row=0, column=2, padx=(20, 0))
+        
+        self.preserve_dir_times_var = tk.BooleanVar(value=False)
+        self.preserve_dir_times_check = ttk.Checkbutton(size_frame, text=self.localizer.get('preserve_dir_times'),
+                                                       variable=self.preserve_dir_times_var)
+        self.preserve_dir_times_check.grid(row=0, column=3, padx=(20, 0))
+        
+        self.bandwidth_var = tk.StringVar(value="0")
+        self.file_rate_var = tk.StringVar(value="0")
+        self.low_io_priority_var = tk.BooleanVar(value=False)
+        
+        self.throttle_label = ttk.Label(size_frame, text=self.localizer.get('throttle_limits'))
+        self.throttle_label.grid(row=1, column=0, columnspan=4, sticky=tk.W, pady=(10, 5))
+        
+        throttle_frame = ttk.Frame(size_frame)
+        throttle_frame.grid(row=2, column=0, columnspan=4, sticky=tk.W)
+        
+        ttk.Spinbox(throttle_frame, from_=0, to=10000, width=10,
+                    textvariable=self.bandwidth_var).grid(row=0, column=0, padx=(0, 5))
+        ttk.Label(throttle_frame, text="MB/s").grid(row=0, column=1, padx=(0, 10))
+        
+        ttk.Spinbox(throttle_frame, from_=0, to=100000, width=10,
+                    textvariable=self.file_rate_var).grid(row=0, column=2, padx=(0, 5))
+        self.file_rate_label = ttk.Label(throttle_frame, text=self.localizer.get('files_per_second'))
+        self.file_rate_label.grid(row=0, column=3)
+        
+        self.low_io_priority_check = ttk.Checkbutton(throttle_frame, text=self.localizer.get('low_io_priority'),
+                                                    variable=self.low_io_priority_var)
+        self.low_io_priority_check.grid(row=0, column=4, padx=(20, 0))
+        
+        self.throttle = Throttle()
+        self.batch_runner = None
+        self.bandwidth_var.trace_add('write', self.update_throttle)
+        self.file_rate_var.trace_add('write', self.update_throttle)
+        
         self.exclude_label = ttk.Label(main_frame, text=self.localizer.get('exclude_dirs'))
         self.exclude_label.grid(row=6, column=0, sticky=tk.W, pady=(0, 5))
         
@@ -273,6 +1475,14 @@ class PathDumper:
                                       command=self.start_dump)
         self.start_button.pack(side=tk.LEFT, padx=(0, 10))
         
+        self.stop_button = ttk.Button(button_frame, text=self.localizer.get('stop_watch'), 
+                                     command=self.stop_watch, state='disabled')
+        self.stop_button.pack(side=tk.LEFT, padx=(0, 10))
+        
+        self.batch_button = ttk.Button(button_frame, text=self.localizer.get('run_batch'), 
+                                      command=self.start_batch)
+        self.batch_button.pack(side=tk.LEFT, padx=(0, 10))
+        
         self.about_button = ttk.Button(button_frame, text=self.localizer.get('about'), 
                   command=self.show_about)
         self.about_button.pack(side=tk.LEFT, padx=(0, 10))
@@ -293,9 +1503,51 @@ class PathDumper:
         self.log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         log_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
         
+        self.localized_widgets = [
+            (self.source_label, 'source_dir'),
+            (self.output_label, 'output_dir'),
+            (self.size_label, 'size_threshold'),
+            (self.exclude_label, 'exclude_dirs'),
+            (self.exclude_manual_label, 'exclude_dirs_manual'),
+            (self.exclude_selected_label, 'exclude_dirs_selected'),
+            (self.force_replace_label, 'force_replace_exts'),
+            (self.replace_preset_label, 'preset_replace'),
+            (self.force_keep_label, 'force_keep_exts'),
+            (self.keep_preset_label, 'preset_keep'),
+            (self.language_label, 'language'),
+            (self.browse_source_btn, 'browse'),
+            (self.browse_output_btn, 'browse'),
+            (self.add_exclude_btn, 'add_exclude_dir'),
+            (self.remove_exclude_btn, 'remove_exclude_dir'),
+            (self.clear_exclude_btn, 'clear_exclude_dirs'),
+            (self.apply_replace_preset_btn, 'apply_preset'),
+            (self.apply_keep_preset_btn, 'apply_preset'),
+            (self.start_button, 'start_dump'),
+            (self.stop_button, 'stop_watch'),
+            (self.batch_button, 'run_batch'),
+            (self.watch_check, 'watch_changes'),
+            (self.preserve_dir_times_check, 'preserve_dir_times'),
+            (self.throttle_label, 'throttle_limits'),
+            (self.file_rate_label, 'files_per_second'),
+            (self.low_io_priority_check, 'low_io_priority'),
+            (self.about_button, 'about'),
+            (self.exit_button, 'exit'),
+            (self.log_frame, 'log'),
+        ]
+        
         self.log("Path Dumper started - Ready to process directories")
         self.log("Select source directory and output directory to begin")
     
+    def update_throttle(self, *args):
+        try:
+            bytes_per_second = float(self.bandwidth_var.get() or 0) * 1024 * 1024
+            files_per_second = float(self.file_rate_var.get() or 0)
+        except ValueError:
+            return
+        self.throttle.set_limits(bytes_per_second, files_per_second)
+        if self.batch_runner is not None:
+            self.batch_runner.throttle.set_limits(bytes_per_second, files_per_second)
+    
     def get_localized_preset_names(self, presets_dict):
         return [self.localizer.get(key, key) for key in presets_dict.keys()]
     
@@ -306,18 +1558,24 @@ class PathDumper:
         return None
     
     def browse_source(self):
+        from tkinter import filedialog
+        
         directory = filedialog.askdirectory(
             title=self.localizer.get('select_source_dir'))
         if directory:
             self.source_var.set(directory)
     
     def browse_output(self):
+        from tkinter import filedialog
+        
         directory = filedialog.askdirectory(
             title=self.localizer.get('select_output_dir'))
         if directory:
             self.output_var.set(directory)
     
     def add_exclude_directory(self):
+        from tkinter import filedialog
+        
         if hasattr(self, 'source_var') and self.source_var.get():
             initial_dir = self.source_var.get()
         else:
@@ -351,6 +1609,8 @@ class PathDumper:
         self.update_exclude_listbox()
     
     def update_exclude_listbox(self):
+        import tkinter as tk
+        
         self.exclude_listbox.delete(0, tk.END)
         for directory in self.selected_exclude_dirs:
             self.exclude_listbox.insert(tk.END, directory)
@@ -394,36 +1654,16 @@ class PathDumper:
     def change_language(self, event=None):
         display_name = self.language_var.get()
         new_locale = self.language_map.get(display_name, 'en')
+        if new_locale == self.localizer.locale:
+            return
         self.localizer = Localizer(new_locale)
         self.update_ui_text()
     
     def update_ui_text(self):
         self.root.title(self.localizer.get('app_title', 'Path Dumper'))
         
-        self.source_label.config(text=self.localizer.get('source_dir'))
-        self.output_label.config(text=self.localizer.get('output_dir'))
-        self.size_label.config(text=self.localizer.get('size_threshold'))
-        self.exclude_label.config(text=self.localizer.get('exclude_dirs'))
-        self.exclude_manual_label.config(text=self.localizer.get('exclude_dirs_manual'))
-        self.exclude_selected_label.config(text=self.localizer.get('exclude_dirs_selected'))
-        self.force_replace_label.config(text=self.localizer.get('force_replace_exts'))
-        self.replace_preset_label.config(text=self.localizer.get('preset_replace'))
-        self.force_keep_label.config(text=self.localizer.get('force_keep_exts'))
-        self.keep_preset_label.config(text=self.localizer.get('preset_keep'))
-        self.language_label.config(text=self.localizer.get('language'))
-        
-        self.browse_source_btn.config(text=self.localizer.get('browse'))
-        self.browse_output_btn.config(text=self.localizer.get('browse'))
-        self.add_exclude_btn.config(text=self.localizer.get('add_exclude_dir'))
-        self.remove_exclude_btn.config(text=self.localizer.get('remove_exclude_dir'))
-        self.clear_exclude_btn.config(text=self.localizer.get('clear_exclude_dirs'))
-        self.apply_replace_preset_btn.config(text=self.localizer.get('apply_preset'))
-        self.apply_keep_preset_btn.config(text=self.localizer.get('apply_preset'))
-        self.start_button.config(text=self.localizer.get('start_dump'))
-        self.about_button.config(text=self.localizer.get('about'))
-        self.exit_button.config(text=self.localizer.get('exit'))
-        
-        self.log_frame.config(text=self.localizer.get('log'))
+        for widget, key in self.localized_widgets:
+            widget.config(text=self.localizer.get(key))
         
         current_status = self.status_var.get()
         if current_status == "Ready" or current_status == "就绪" or current_status == "就緒":
@@ -433,6 +1673,8 @@ class PathDumper:
         self.keep_preset_combo['values'] = self.get_localized_preset_names(self.keep_presets)
     
     def show_about(self):
+        from tkinter import messagebox
+        
         about_text = self.localizer.get('about_text', """Path Dumper v1.0
 
 A tool for creating directory structure archives with large file placeholders.
@@ -459,6 +1701,8 @@ Large files will be replaced with text placeholders containing original size and
         messagebox.showinfo(self.localizer.get('about'), about_text)
     
     def log(self, message):
+        import tkinter as tk
+        
         timestamp = datetime.now().strftime("%H:%M:%S")
         log_message = f"[{timestamp}] {message}\n"
         
@@ -478,6 +1722,8 @@ Large files will be replaced with text placeholders containing original size and
             pass
     
     def start_dump(self):
+        from tkinter import messagebox
+        
         if self.is_processing:
             return
         
@@ -513,28 +1759,27 @@ Large files will be replaced with text placeholders containing original size and
         seen = set()
         exclude_dirs = [x for x in exclude_dirs if not (x in seen or seen.add(x))]
         
-        force_replace_exts = []
-        force_text = self.force_replace_var.get().strip()
-        if force_text:
-            force_replace_exts = [ext.strip().lower() for ext in force_text.split(',') if ext.strip()]
-            force_replace_exts = [ext if ext.startswith('.') else '.' + ext for ext in force_replace_exts]
+        force_replace_exts = parse_extensions(self.force_replace_var.get())
         
-        force_keep_exts = []
-        keep_text = self.force_keep_var.get().strip()
-        if keep_text:
-            force_keep_exts = [ext.strip().lower() for ext in keep_text.split(',') if ext.strip()]
-            force_keep_exts = [ext if ext.startswith('.') else '.' + ext for ext in force_keep_exts]
+        force_keep_exts = parse_extensions(self.force_keep_var.get())
         
         self.is_processing = True
         self.start_button.config(state='disabled')
         self.progress_var.set(0)
+        self.stop_event.clear()
         
         thread = threading.Thread(target=self.perform_dump, 
-                                args=(source_dir, output_dir, size_threshold, exclude_dirs, force_replace_exts, force_keep_exts))
+                                args=(source_dir, output_dir, size_threshold, exclude_dirs, force_replace_exts, force_keep_exts,
+                                      self.watch_var.get(), self.preserve_dir_times_var.get(),
+                                      self.low_io_priority_var.get()))
         thread.daemon = True
         thread.start()
     
-    def perform_dump(self, source_dir, output_dir, size_threshold, exclude_dirs, force_replace_exts, force_keep_exts):
+    def perform_dump(self, source_dir, output_dir, size_threshold, exclude_dirs, force_replace_exts, force_keep_exts,
+                     watch=False, preserve_dir_times=False, low_io_priority=False):
+        from tkinter import messagebox
+        
+        watcher = None
         try:
             self.log(f"Starting sync process...")
             self.log(f"Source: {source_dir}")
@@ -547,106 +1792,28 @@ Large files will be replaced with text placeholders containing original size and
             if force_keep_exts:
                 self.log(f"Force keep extensions: {', '.join(force_keep_exts)}")
             
-            source_path = Path(source_dir).resolve()
-            output_path = Path(output_dir).resolve()
+            job = SyncJob(source_dir, output_dir, size_threshold, exclude_dirs, force_replace_exts, force_keep_exts,
+                          self.localizer, self.log)
+            job.preserve_dir_times = preserve_dir_times
+            job.throttle = self.throttle
+            job.low_io_priority = low_io_priority
             
-            try:
-                output_path.relative_to(source_path)
+            error_key = job.check_paths()
+            if error_key:
                 messagebox.showerror(self.localizer.get('error'), 
-                                   self.localizer.get('output_inside_source'))
-                return
-            except ValueError:
-                pass
-            
-            try:
-                source_path.relative_to(output_path)
-                messagebox.showerror(self.localizer.get('error'), 
-                                   self.localizer.get('source_inside_output'))
-                return
-            except ValueError:
-                pass
-            
-            if not os.path.exists(source_dir) or not os.path.isdir(source_dir):
-                messagebox.showerror(self.localizer.get('error'), 
-                                   self.localizer.get('invalid_source_dir'))
-                return
-            
-            os.makedirs(output_dir, exist_ok=True)
-            
-            try:
-                test_files = list(os.listdir(source_dir))[:5]
-                self.log(f"Directory access test passed, found {len(test_files)} test items")
-            except PermissionError:
-                messagebox.showerror(self.localizer.get('error'), 
-                                   self.localizer.get('permission_denied'))
+                                   self.localizer.get(error_key))
                 return
             
             self.status_var.set(self.localizer.get('scanning_files'))
             self.log(self.localizer.get('start_scanning'))
             
-            all_files = []
-            skipped_files = []
-            excluded_count = 0
-            processed_dirs = 0
+            watcher = job.create_watcher(self.stop_event) if watch else None
             
-            for root, dirs, files in os.walk(source_dir):
-                rel_root = os.path.relpath(root, source_dir)
-                should_exclude = False
-                
-                for exclude_dir in exclude_dirs:
-                    exclude_dir = exclude_dir.replace('\\', os.sep).replace('/', os.sep)
-                    rel_root_normalized = rel_root.replace('\\', os.sep).replace('/', os.sep)
-                    
-                    if (rel_root_normalized == exclude_dir or
-                        rel_root_normalized.startswith(exclude_dir + os.sep) or
-                        exclude_dir.startswith(rel_root_normalized + os.sep) or
-                        (os.sep + exclude_dir + os.sep) in (os.sep + rel_root_normalized + os.sep) or
-                        exclude_dir in os.path.basename(root)):
-                        should_exclude = True
-                        break
-                
-                if should_exclude:
-                    dirs.clear()
-                    excluded_count += len(files)
-                    continue
-                
-                dirs_to_remove = []
-                for d in dirs:
-                    for exclude_dir in exclude_dirs:
-                        exclude_dir = exclude_dir.replace('\\', os.sep).replace('/', os.sep)
-                        if (d == exclude_dir or 
-                            exclude_dir == os.path.join(rel_root, d) or
-                            exclude_dir in d):
-                            dirs_to_remove.append(d)
-                            break
-                
-                for d in dirs_to_remove:
-                    if d in dirs:
-                        dirs.remove(d)
-                
-                processed_dirs += 1
-                if processed_dirs % 10 == 0:
-                    self.log(f"Scanning... processed {processed_dirs} directories, found {len(all_files)} files")
-                
-                try:
-                    root_str = str(root)
-                    for file in files:
-                        try:
-                            file_path = os.path.join(root_str, file)
-                            if os.path.exists(file_path) and os.path.isfile(file_path):
-                                all_files.append(file_path)
-                            else:
-                                skipped_files.append(file_path)
-                        except (UnicodeDecodeError, OSError) as e:
-                            skipped_files.append(f"{root}/{file} (encoding error)")
-                            continue
-                except Exception as e:
-                    self.log(f"Error accessing directory {root}: {e}")
-                    continue
+            file_table, skipped_count, excluded_count = job.scan()
             
-            total_files = len(all_files)
-            if skipped_files:
-                self.log(f"Skipped {len(skipped_files)} inaccessible files")
+            total_files = len(file_table)
+            if skipped_count:
+                self.log(f"Skipped {skipped_count} inaccessible files")
             if excluded_count > 0:
                 self.log(f"{self.localizer.get('excluded_dirs')}: {excluded_count} files")
             
@@ -665,107 +1832,9 @@ Large files will be replaced with text placeholders containing original size and
             
             self.status_var.set(self.localizer.get('creating_dump'))
             
-            processed = 0
-            large_files_count = 0
-            force_replaced_count = 0
-            force_kept_count = 0
-            error_files = []
-            last_log_time = 0
-            log_interval = 1.0
-            
-            for file_path in all_files:
-                try:
-                    try:
-                        rel_path = os.path.relpath(file_path, source_dir)
-                    except ValueError:
-                        rel_path = file_path.replace(source_dir, '').lstrip(os.sep)
-                    
-                    dest_path = os.path.join(output_dir, rel_path)
-                    
-                    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-                    
-                    try:
-                        file_size = os.path.getsize(file_path)
-                        file_ext = os.path.splitext(file_path)[1].lower()
-                    except (OSError, IOError) as e:
-                        with open(dest_path, 'w', encoding='utf-8') as f:
-                            f.write(f"# Error accessing file\n")
-                            f.write(f"# Original path: {file_path}\n")
-                            f.write(f"# Error: {e}\n")
-                        processed += 1
-                        continue
-                    
-                    force_keep = file_ext in force_keep_exts
-                    
-                    force_replace = file_ext in force_replace_exts
-                    
-                    if force_keep:
-                        try:
-                            shutil.copy2(file_path, dest_path)
-                            force_kept_count += 1
-                            
-                            current_time = datetime.now().timestamp()
-                            if current_time - last_log_time > log_interval:
-                                self.log(f"{self.localizer.get('force_kept_file')}: {rel_path}")
-                                last_log_time = current_time
-                        except (OSError, IOError, PermissionError) as e:
-                            with open(dest_path, 'w', encoding='utf-8') as f:
-                                f.write(f"# Copy failed for force-keep file\n")
-                                f.write(f"# Original size: {file_size} bytes\n")
-                                f.write(f"# Original path: {file_path}\n")
-                                f.write(f"# Error: {e}\n")
-                            error_files.append(file_path)
-                    elif force_replace or file_size > size_threshold:
-                        with open(dest_path, 'w', encoding='utf-8') as f:
-                            if force_replace:
-                                f.write(f"# Placeholder for force-replaced file\n")
-                                f.write(f"# Extension: {file_ext}\n")
-                            else:
-                                f.write(f"# Placeholder for large file\n")
-                            f.write(f"# Original size: {file_size} bytes\n")
-                            f.write(f"# Original path: {file_path}\n")
-                        
-                        if force_replace:
-                            force_replaced_count += 1
-                        else:
-                            large_files_count += 1
-                        
-                        current_time = datetime.now().timestamp()
-                        if current_time - last_log_time > log_interval:
-                            if force_replace:
-                                self.log(f"{self.localizer.get('force_replaced_file')}: {rel_path}")
-                            else:
-                                self.log(f"{self.localizer.get('replaced_large_file')}: {rel_path} ({file_size} bytes)")
-                            last_log_time = current_time
-                    else:
-                        try:
-                            shutil.copy2(file_path, dest_path)
-                        except (OSError, IOError, PermissionError) as e:
-                            with open(dest_path, 'w', encoding='utf-8') as f:
-                                f.write(f"# Copy failed for file\n")
-                                f.write(f"# Original size: {file_size} bytes\n")
-                                f.write(f"# Original path: {file_path}\n")
-                                f.write(f"# Error: {e}\n")
-                            error_files.append(file_path)
-                    
-                    processed += 1
-                    
-                    if total_files > 0 and processed % 10 == 0:
-                        progress = (processed / total_files) * 100
-                        def update_progress():
-                            self.progress_var.set(progress)
-                        self.root.after(0, update_progress)
-                    
-                    if processed % 50 == 0:
-                        progress_percent = int((processed / total_files) * 100) if total_files > 0 else 0
-                        self.log(f"Processing... {processed}/{total_files} files ({progress_percent}%) - {large_files_count} large, {force_replaced_count} force replaced, {force_kept_count} force kept")
-                    
-                    if processed % 1000 == 0:
-                        self.log(f"Milestone: {processed} files processed, {large_files_count} large files, {force_replaced_count} force replaced, {force_kept_count} force kept, {len(error_files)} errors")
-                    
-                except Exception as e:
-                    self.log(f"{self.localizer.get('error_processing_file')}: {file_path} - {e}")
-                    error_files.append(file_path)
+            def update_progress(processed, total):
+                self.root.after(0, lambda: self.progress_var.set((processed / total) * 100))
+            job.dump_all(file_table, update_progress)
             
             def final_update():
                 self.progress_var.set(100)
@@ -774,13 +1843,13 @@ Large files will be replaced with text placeholders containing original size and
             
             self.log(f"{self.localizer.get('dump_completed')}")
             self.log(f"{self.localizer.get('total_files')}: {total_files}")
-            self.log(f"{self.localizer.get('large_files_replaced')}: {large_files_count}")
-            if force_replaced_count > 0:
-                self.log(f"{self.localizer.get('force_replaced_files')}: {force_replaced_count}")
-            if force_kept_count > 0:
-                self.log(f"{self.localizer.get('force_kept_files')}: {force_kept_count}")
-            if error_files:
-                self.log(f"Files with errors: {len(error_files)}")
+            self.log(f"{self.localizer.get('large_files_replaced')}: {job.large_files_count}")
+            if job.force_replaced_count > 0:
+                self.log(f"{self.localizer.get('force_replaced_files')}: {job.force_replaced_count}")
+            if job.force_kept_count > 0:
+                self.log(f"{self.localizer.get('force_kept_files')}: {job.force_kept_count}")
+            if job.error_count:
+                self.log(f"Files with errors: {job.error_count}")
             self.log(f"Output directory: {output_dir}")
             
             def show_success():
@@ -788,6 +1857,13 @@ Large files will be replaced with text placeholders containing original size and
                                   self.localizer.get('dump_completed_successfully'))
             self.root.after(0, show_success)
             
+            if watcher is not None:
+                def enter_watch():
+                    self.status_var.set(self.localizer.get('watching'))
+                    self.stop_button.config(state='normal')
+                self.root.after(0, enter_watch)
+                job.watch(watcher, self.stop_event, file_table)
+            
         except Exception as e:
             error_msg = f"{self.localizer.get('dump_failed')}: {e}"
             self.log(error_msg)
@@ -798,16 +1874,121 @@ Large files will be replaced with text placeholders containing original size and
             self.root.after(0, update_error_status)
         
         finally:
+            if watcher is not None:
+                watcher.close()
+            
             def final_cleanup():
                 self.is_processing = False
                 self.start_button.config(state='normal')
+                self.stop_button.config(state='disabled')
             self.root.after(0, final_cleanup)
     
+    def start_batch(self):
+        from tkinter import filedialog, messagebox
+        
+        if self.is_processing:
+            return
+        
+        batch_file = filedialog.askopenfilename(
+            title=self.localizer.get('select_batch_file'),
+            filetypes=[('JSON', '*.json'), ('All files', '*.*')])
+        if not batch_file:
+            return
+        
+        try:
+            runner = BatchRunner(batch_file, self.localizer, self.log,
+                                 self.throttle.bandwidth.rate, self.throttle.file_rate.rate)
+        except (OSError, ValueError) as e:
+            messagebox.showerror(self.localizer.get('error'), str(e))
+            return
+        
+        self.is_processing = True
+        self.batch_runner = runner
+        self.start_button.config(state='disabled')
+        self.batch_button.config(state='disabled')
+        self.status_var.set(self.localizer.get('creating_dump'))
+        
+        def perform_batch():
+            try:
+                results = runner.run()
+                failed = sum(1 for result in results if result['error'])
+                
+                def show_summary():
+                    self.status_var.set(self.localizer.get('completed') if not failed else self.localizer.get('failed'))
+                    messagebox.showinfo(self.localizer.get('success'), 
+                                      f"{self.localizer.get('batch_completed')}: {len(results) - failed}/{len(results)}")
+                self.root.after(0, show_summary)
+            finally:
+                def final_cleanup():
+                    self.is_processing = False
+                    self.batch_runner = None
+                    self.start_button.config(state='normal')
+                    self.batch_button.config(state='normal')
+                self.root.after(0, final_cleanup)
+        
+        thread = threading.Thread(target=perform_batch)
+        thread.daemon = True
+        thread.start()
+    
+    def stop_watch(self):
+        self.stop_event.set()
+        self.stop_button.config(state='disabled')
+        self.status_var.set(self.localizer.get('completed'))
+    
     def run(self):
         self.root.mainloop()
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Path Dumper - Directory Structure Synchronizer')
+    parser.add_argument('--batch', metavar='FILE', help='run every job in a JSON batch file without the GUI')
+    parser.add_argument('--restore-plan', metavar='DUMP_DIR',
+                        help='list the original files referenced by placeholders in a dump')
+    parser.add_argument('--subtree', default='', help='limit --restore-plan to a path inside the dump or an original source path')
+    parser.add_argument('--workers', type=int, default=8, help='parallel placeholder readers for --restore-plan')
+    parser.add_argument('--output', metavar='FILE', help='write the --restore-plan list to FILE instead of stdout')
+    args = parser.parse_args()
+    
+    if args.restore_plan:
+        output_path = args.output
+        if output_path is None and sys.stdout is None:
+            output_path = os.path.normpath(args.restore_plan) + '-restore-plan.txt'
+        output = open(output_path, 'w', encoding='utf-8') if output_path else sys.stdout
+        report = sys.stderr or output
+        
+        with output if output_path else contextlib.nullcontext():
+            if not os.path.isdir(args.restore_plan):
+                print(f"Dump directory not found: {args.restore_plan}", file=report)
+                sys.exit(1)
+            
+            started = time.monotonic()
+            index = PlaceholderIndex(args.restore_plan, args.workers).build()
+            plan = index.plan(args.subtree)
+            total_bytes = sum(size for _, _, size in plan if size > 0)
+            unknown = sum(1 for _, _, size in plan if size < 0)
+            for rel_path, original_path, size in plan:
+                print(f"{size if size >= 0 else '?'}\t{original_path}", file=output)
+            print(f"Restore plan: {len(plan)} files, {total_bytes} bytes ({total_bytes / (1024**3):.2f} GB)"
+                  + (f", {unknown} with unknown size" if unknown else "")
+                  + f" - indexed {len(index)} placeholders in {time.monotonic() - started:.1f}s", file=report)
+        return
+    
+    if args.batch:
+        log_file = sys.stdout
+        if log_file is None:
+            log_file = open(os.path.splitext(args.batch)[0] + '.log', 'a', encoding='utf-8')
+        
+        def console_log(message):
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}", file=log_file, flush=True)
+        
+        try:
+            runner = BatchRunner(args.batch, Localizer(), console_log)
+        except (OSError, ValueError) as e:
+            console_log(f"Invalid batch file {args.batch}: {e}")
+            sys.exit(1)
+        results = runner.run()
+        sys.exit(1 if any(result['error'] for result in results) else 0)
+    
     app = PathDumper()
     app.run()
 
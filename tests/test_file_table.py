@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from pathlib import Path
+import os
+import sys
+import unittest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from main import FileTable
+
+
+def build(entries):
+    table = FileTable()
+    for root, files in entries:
+        dir_id = table.add_dir(root)
+        for name, size, mtime in files:
+            table.add(dir_id, name, size, mtime, 0o100644)
+    return table
+
+
+class FileTableTest(unittest.TestCase):
+    def test_round_trip(self):
+        table = build([
+            ('/r', [('a.mkv', 1, 10), ('b.mkv', 2, 20)]),
+            ('/r/empty', []),
+            ('/r/sub', [('c d.txt', 3, 30), ('\udcff.bin', 4, 40)]),
+        ])
+        
+        self.assertEqual(len(table), 4)
+        self.assertEqual([(entry.path, entry.size, entry.mtime) for entry in table], [
+            (os.path.join('/r', 'a.mkv'), 1, 10),
+            (os.path.join('/r', 'b.mkv'), 2, 20),
+            (os.path.join('/r/sub', 'c d.txt'), 3, 30),
+            (os.path.join('/r/sub', '\udcff.bin'), 4, 40),
+        ])
+        self.assertEqual(table[2].path, os.path.join('/r/sub', 'c d.txt'))
+        self.assertEqual(table[-1].size, 4)
+    
+    def test_read_while_filling_directory(self):
+        table = FileTable()
+        dir_id = table.add_dir('/r')
+        table.add(dir_id, 'a', 1, 1, 0o100644)
+        self.assertEqual(table[0].path, os.path.join('/r', 'a'))
+        table.add(dir_id, 'b', 2, 2, 0o100644)
+        
+        self.assertEqual([entry.path for entry in table], [os.path.join('/r', 'a'), os.path.join('/r', 'b')])
+        self.assertEqual(table[1].path, os.path.join('/r', 'b'))
+    
+    def test_changes_since(self):
+        previous = build([
+            ('/r', [('same', 1, 1), ('resized', 1, 1), ('touched', 1, 1), ('deleted', 1, 1)]),
+            ('/r/gone', [('x', 1, 1)]),
+        ])
+        current = build([
+            ('/r', [('same', 1, 1), ('resized', 2, 1), ('touched', 1, 2), ('added', 1, 1)]),
+            ('/r/new', [('y', 1, 1)]),
+        ])
+        
+        self.assertEqual(current.changes_since(previous), {
+            os.path.join('/r', 'resized'),
+            os.path.join('/r', 'touched'),
+            os.path.join('/r', 'added'),
+            os.path.join('/r', 'deleted'),
+            os.path.join('/r/new', 'y'),
+            '/r/gone',
+            os.path.join('/r/gone', 'x'),
+        })
+        self.assertEqual(current.changes_since(current), set())
+
+
+if __name__ == "__main__":
+    unittest.main()